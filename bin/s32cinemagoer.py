@@ -22,6 +22,7 @@ along with this program; if not, write to the Free Software
 Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 """
 
+import io
 import os
 import glob
 import gzip
@@ -73,18 +74,20 @@ def generate_content(fd, headers, table):
     elif table_name == 'title_akas':
         soundex_key = 'title'
         soundex_fn = title_soundex
+    # resolve the transformation of each column once, in the order of
+    # the fields of a line.
+    columns = [(header, data_transf.get(header)) for header in headers]
     for line in fd:
-        s_line = line.decode('utf-8').strip().split('\t')
+        s_line = line.strip().split('\t')
         if len(s_line) != headers_len:
             continue
-        info = {
-            header: (value if value != r'\N' else None)
-            for header, value in zip(headers, s_line)
-        }
-        for key, tranf in data_transf.items():
-            if key not in info:
-                continue
-            info[key] = tranf(info[key])
+        info = {}
+        for (header, tranf), value in zip(columns, s_line):
+            if value == r'\N':
+                value = None
+            if tranf is not None:
+                value = tranf(value)
+            info[header] = value
         if soundex_fn is not None:
             info['t_soundex'] = soundex_fn(info[soundex_key])
         elif table_name == 'name_basics':
@@ -152,7 +155,9 @@ def import_file(fn, engine):
     count = 0
     fn_basename = os.path.basename(fn)
     with gzip.GzipFile(fn, 'rb') as gz_file:
-        headers = gz_file.readline().decode('utf-8').strip().split('\t')
+        # decode the stream in large chunks, instead of one line at a time.
+        fd = io.TextIOWrapper(gz_file, encoding='utf-8', newline='\n')
+        headers = fd.readline().strip().split('\t')
         logging.debug('headers of file %s: %s' % (fn, ','.join(headers)))
         table = build_table(fn_basename, headers, create_indexes=False)
         insert = table.insert()
@@ -165,7 +170,7 @@ def import_file(fn, engine):
                 except Exception:
                     pass
                 table.create(bind=connection, checkfirst=True)
-                iterator = tqdm(gz_file) if use_tqdm else gz_file
+                iterator = tqdm(fd) if use_tqdm else fd
                 for block in generate_content(iterator, headers, table):
                     try:
                         connection.execute(insert, block)
@@ -528,8 +528,10 @@ def parseXML(xml):
     return parseTags(lxml.etree.fromstring(xml))
 
 
-_re_akas_lang = re.compile('(?:[(])([a-zA-Z]+?)(?: title[)])')
-_re_akas_country = re.compile(r'\(.*?\)')
+# Negated character classes instead of lazy quantifiers: same matches.
+_re_akas_split = re.compile(r'^(.*) \(([^)\n]*)\)')
+_re_akas_lang = re.compile(r'\(([a-zA-Z]+) title\)')
+_re_akas_country = re.compile(r'\([^)\n]*\)')
 
 
 # akasLanguages, sortAKAsBySimilarity and getAKAsInLanguage code
@@ -541,7 +543,7 @@ def akasLanguages(movie):
     akas = set((movie.get('akas') or []) + (movie.get('akas from release info') or []))
     for aka in akas:
         # split aka
-        aka = re.search(r'^(.*) \((.*?)\)', aka).group(1, 2)
+        aka = _re_akas_split.search(aka).group(1, 2)
         # sometimes there is no countries information
         if len(aka) == 2:
             # search for something like "(... title)" where ... is a language
@@ -608,13 +610,16 @@ def getAKAsInLanguage(movie, lang, _searchedTitle=None):
     return akas
 
 
+_re_image_url = re.compile(r'https://m.media-amazon.com/images/\w/\w+')
+
+
 def resizeImage(image, width=None, height=None, crop=None, custom_regex=None):
     """Return resized and cropped image url."""
 
-    regexString = custom_regex if custom_regex else r'https://m.media-amazon.com/images/\w/\w+'
+    regex = re.compile(custom_regex) if custom_regex else _re_image_url
 
     try:
-        resultImage = re.findall(regexString, image)[0]
+        resultImage = regex.findall(image)[0]
     except IndexError:
         raise IMDbError('Image url not matched. Original url: "%s"' % (image))
 
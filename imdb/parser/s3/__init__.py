@@ -24,6 +24,7 @@ called with the ``accessSystem`` parameter is set to "s3" or an s3 alias.
 
 import logging
 from operator import itemgetter
+from types import MappingProxyType
 
 import sqlalchemy
 
@@ -62,7 +63,12 @@ class IMDbS3AccessSystem(IMDbBase):
 
     accessSystem = 's3'
 
-    _KIND_REV = {v: k for k, v in KIND.items()}
+    # shared by all the instances: read-only.
+    _KIND_REV = MappingProxyType({v: k for k, v in KIND.items()})
+    _RENAMES = MappingProxyType({
+        table: {column: conf['rename'] for column, conf in columns.items() if 'rename' in conf}
+        for table, columns in DB_TRANSFORM.items()
+    })
 
     def get_movie_infoset(self):
         return ['main', 'plot']
@@ -78,16 +84,13 @@ class IMDbS3AccessSystem(IMDbBase):
         self._engine = sqlalchemy.create_engine(uri, echo=False)
         self._metadata.reflect(bind=self._engine)
         self.T = self._metadata.tables
+        self._statements = {}
 
     def _rename(self, table, data):
-        for column, conf in DB_TRANSFORM.get(table, {}).items():
-            if 'rename' not in conf:
-                continue
-            if column not in data:
-                continue
-            data[conf['rename']] = data[column]
-            del data[column]
-        return data
+        """Return a new dictionary, with the columns of the given table
+        renamed as specified in DB_TRANSFORM."""
+        renames = self._RENAMES.get(table) or {}
+        return {renames.get(key, key): value for key, value in data.items()}
 
     def _clean(self, data, keys_to_remove=None):
         if keys_to_remove is None:
@@ -98,7 +101,7 @@ class IMDbS3AccessSystem(IMDbBase):
         return data
 
     def _normalize_title_data(self, row_data):
-        data = self._rename('title_basics', dict(row_data))
+        data = self._rename('title_basics', row_data)
         data['year'] = str(data.get('startYear') or '')
         if 'endYear' in data and data['endYear']:
             data['year'] += '-%s' % data['endYear']
@@ -109,14 +112,25 @@ class IMDbS3AccessSystem(IMDbBase):
         self._clean(data, ('startYear', 'endYear', 'movieID'))
         return data
 
-    def _fetchone(self, statement):
+    def _select_by_id(self, table, column):
+        """Return a SELECT on table, filtered on the given column being
+        equal to the "id" bound parameter; the statement is built once and
+        shared by all the lookups on the same table and column."""
+        statement = self._statements.get((table, column))
+        if statement is None:
+            t = self.T[table]
+            statement = sqlalchemy.select(t).where(t.c[column] == sqlalchemy.bindparam('id'))
+            self._statements[(table, column)] = statement
+        return statement
+
+    def _fetchone(self, statement, params=None):
         with self._engine.connect() as connection:
-            row = connection.execute(statement).mappings().first()
+            row = connection.execute(statement, params).mappings().first()
         return dict(row) if row else None
 
-    def _fetchall(self, statement):
+    def _fetchall(self, statement, params=None):
         with self._engine.connect() as connection:
-            rows = connection.execute(statement).mappings().all()
+            rows = connection.execute(statement, params).mappings().all()
         return [dict(row) for row in rows]
 
     def _base_title_info(self, movieID, movies_cache=None, persons_cache=None):
@@ -126,12 +140,26 @@ class IMDbS3AccessSystem(IMDbBase):
             persons_cache = {}
         if movieID in movies_cache:
             return movies_cache[movieID]
-        tb = self.T['title_basics']
-        movie = self._fetchone(sqlalchemy.select(tb).where(tb.c.tconst == movieID)) or {}
+        movie = self._fetchone(self._select_by_id('title_basics', 'tconst'), {'id': movieID}) or {}
         data = self._normalize_title_data(movie)
         movies_cache[movieID] = data
         return data
 
+    def _base_titles_info(self, movieIDs, movies_cache=None):
+        """Like _base_title_info, for a list of movieIDs; the titles that
+        are not already cached are fetched with a single query."""
+        if movies_cache is None:
+            movies_cache = {}
+        missing = [movieID for movieID in movieIDs if movieID not in movies_cache]
+        if missing:
+            tb = self.T['title_basics']
+            for movie in self._fetchall(sqlalchemy.select(tb).where(tb.c.tconst.in_(missing))):
+                movies_cache[movie['tconst']] = self._normalize_title_data(movie)
+            for movieID in missing:
+                if movieID not in movies_cache:
+                    movies_cache[movieID] = self._normalize_title_data({})
+        return [movies_cache[movieID] for movieID in movieIDs]
+
     def _base_person_info(self, personID, movies_cache=None, persons_cache=None):
         if movies_cache is None:
             movies_cache = {}
@@ -139,18 +167,12 @@ class IMDbS3AccessSystem(IMDbBase):
             persons_cache = {}
         if personID in persons_cache:
             return persons_cache[personID]
-        nb = self.T['name_basics']
-        person = self._fetchone(sqlalchemy.select(nb).where(nb.c.nconst == personID)) or {}
+        person = self._fetchone(self._select_by_id('name_basics', 'nconst'), {'id': personID}) or {}
         data = self._rename('name_basics', person)
-        movies = []
-        for movieID in split_array(data.get('known for') or ''):
-            if not movieID:
-                continue
-            movieID = int(movieID)
-            movie_data = self._base_title_info(movieID, movies_cache=movies_cache, persons_cache=persons_cache)
-            movie = Movie(movieID=movieID, data=movie_data, accessSystem=self.accessSystem)
-            movies.append(movie)
-        data['known for'] = movies
+        movieIDs = [int(x) for x in split_array(data.get('known for') or '') if x]
+        movies_data = self._base_titles_info(movieIDs, movies_cache=movies_cache)
+        data['known for'] = [Movie(movieID=movieID, data=movie_data, accessSystem=self.accessSystem)
+                             for movieID, movie_data in zip(movieIDs, movies_data)]
         self._clean(data, ('ns_soundex', 'sn_soundex', 's_soundex', 'personID'))
         persons_cache[personID] = data
         return data
@@ -161,8 +183,7 @@ class IMDbS3AccessSystem(IMDbBase):
         _movies_cache = {movieID: data}
         _persons_cache = {}
 
-        tc = self.T['title_crew']
-        movie = self._fetchone(sqlalchemy.select(tc).where(tc.c.tconst == movieID)) or {}
+        movie = self._fetchone(self._select_by_id('title_crew', 'tconst'), {'id': movieID}) or {}
         tc_data = self._rename('title_crew', movie)
         writers = []
         directors = []
@@ -180,20 +201,17 @@ class IMDbS3AccessSystem(IMDbBase):
         tc_data['writer'] = writers
         data.update(tc_data)
 
-        te = self.T['title_episode']
-        movie = self._fetchone(sqlalchemy.select(te).where(te.c.tconst == movieID)) or {}
+        movie = self._fetchone(self._select_by_id('title_episode', 'tconst'), {'id': movieID}) or {}
         te_data = self._rename('title_episode', movie)
         if 'parentTconst' in te_data:
             te_data['episodes of'] = self._base_title_info(te_data['parentTconst'])
         self._clean(te_data, ('parentTconst',))
         data.update(te_data)
 
-        tp = self.T['title_principals']
-        movie_rows = self._fetchall(sqlalchemy.select(tp).where(tp.c.tconst == movieID)) or []
+        movie_rows = self._fetchall(self._select_by_id('title_principals', 'tconst'), {'id': movieID}) or []
         roles = {}
         for movie_row in movie_rows:
-            tp_data = self._rename('title_principals', dict(movie_row))
-            category = tp_data.get('category')
+            category = movie_row.get('category')
             if not category:
                 continue
             if category in ('actor', 'actress', 'self'):
@@ -217,26 +235,20 @@ class IMDbS3AccessSystem(IMDbBase):
                 persons.append(person)
             data[role] = persons
 
-        tr = self.T['title_ratings']
-        movie = self._fetchone(sqlalchemy.select(tr).where(tr.c.tconst == movieID)) or {}
+        movie = self._fetchone(self._select_by_id('title_ratings', 'tconst'), {'id': movieID}) or {}
         tr_data = self._rename('title_ratings', movie)
         data.update(tr_data)
 
-        ta = self.T['title_akas']
-        akas = self._fetchall(sqlalchemy.select(ta).where(ta.c.titleId == movieID))
+        akas = self._fetchall(self._select_by_id('title_akas', 'titleId'), {'id': movieID})
         akas_list = []
         for aka in akas:
-            ta_data = self._rename('title_akas', aka) or {}
-            for key in list(ta_data.keys()):
-                if not ta_data[key]:
-                    del ta_data[key]
-            for key in 't_soundex', 'movieID':
-                if key in ta_data:
-                    del ta_data[key]
-            for key in 'types', 'attributes':
-                if key not in ta_data:
+            ta_data = {}
+            for key, value in self._rename('title_akas', aka).items():
+                if not value or key in ('t_soundex', 'movieID'):
                     continue
-                ta_data[key] = split_array(ta_data[key])
+                if key in ('types', 'attributes'):
+                    value = split_array(value)
+                ta_data[key] = value
             akas_list.append(ta_data)
         if akas_list:
             data['akas'] = akas_list
@@ -330,7 +342,7 @@ class IMDbS3AccessSystem(IMDbBase):
             else:
                 ta_statement = sqlalchemy.select(ta).where(sqlalchemy.and_(*ta_conditions))
             ta_results = self._fetchall(ta_statement)
-            ta_results = [(x['titleId'], self._clean(self._rename('title_akas', dict(x)), ('t_soundex',)))
+            ta_results = [(x['titleId'], self._clean(self._rename('title_akas', x), ('t_soundex',)))
                           for x in ta_results]
             results += ta_results
 
@@ -358,16 +370,17 @@ class IMDbS3AccessSystem(IMDbBase):
         ns_soundex, sn_soundex, s_soundex = name_soundexes(name)
         nb = self.T['name_basics']
         query_soundexes = [x for x in (ns_soundex, sn_soundex, s_soundex) if x]
-        conditions = []
-        for query_soundex in query_soundexes:
-            conditions.extend([
-                nb.c.ns_soundex == query_soundex,
-                nb.c.sn_soundex == query_soundex,
-                nb.c.s_soundex == query_soundex,
-            ])
-        statement = sqlalchemy.select(nb).where(sqlalchemy.or_(*conditions))
+        statement = sqlalchemy.select(nb)
+        if query_soundexes:
+            # one IN test for each column, instead of a comparison for
+            # every (column, soundex) pair.
+            statement = statement.where(sqlalchemy.or_(
+                nb.c.ns_soundex.in_(query_soundexes),
+                nb.c.sn_soundex.in_(query_soundexes),
+                nb.c.s_soundex.in_(query_soundexes),
+            ))
         results = self._fetchall(statement)
-        results = [(x['nconst'], self._clean(self._rename('name_basics', dict(x)),
+        results = [(x['nconst'], self._clean(self._rename('name_basics', x),
                                              ('ns_soundex', 'sn_soundex', 's_soundex')))
                    for x in results]
         results = scan_names(results, name)
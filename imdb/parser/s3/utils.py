@@ -20,6 +20,8 @@ This package provides utilities for the s3 dataset.
 
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
+from types import MappingProxyType
 
 import sqlalchemy
 
@@ -200,6 +202,10 @@ def soundex(s, length=SOUNDEX_LENGTH):
     return soundCode or None
 
 
+# Only runs of the same title in adjacent title_akas rows of a movie, and
+# repeated searches, hit the cache: s32cinemagoer.py imports each file in
+# a separate pass, so title_basics and title_akas never share results.
+@lru_cache(maxsize=1024)
 def title_soundex(title):
     """Return the soundex code for the given title; the (optional) starting article is pruned.
 
@@ -311,6 +317,28 @@ def strip_article(title):
     return no_article_title
 
 
+# Used to rank titles with the same similarity score.
+_kind_scores = MappingProxyType({
+    'movie': 6,
+    'tv movie': 5,
+    'tv series': 4,
+    'tv mini series': 4,
+    'tv special': 3,
+    'tv short': 2,
+    'short': 1,
+    'video': 1,
+    'episode': 0,
+})
+
+
+def _title_sort_key(item):
+    """Sort key for the (ratio, (movieID, t_data)) items of scan_titles."""
+    t_data = item[1][1]
+    year = t_data.get('year')
+    return (item[0], _kind_scores.get(t_data.get('kind'), 0),
+            1 if year not in (None, '', 'None') else 0)
+
+
 def scan_titles(titles_list, title, results=0, ro_threshold=RO_THRESHOLD):
     """Scan a list of titles, searching for best matches amongst some variations.
 
@@ -330,27 +358,6 @@ def scan_titles(titles_list, title, results=0, ro_threshold=RO_THRESHOLD):
     sm2 = SequenceMatcher()
     sm2.set_seq2(no_article_title.lower())
     resd = {}
-
-    kind_scores = {
-        'movie': 6,
-        'tv movie': 5,
-        'tv series': 4,
-        'tv mini series': 4,
-        'tv special': 3,
-        'tv short': 2,
-        'short': 1,
-        'video': 1,
-        'episode': 0,
-    }
-
-    def _sort_score(t_data):
-        kind = t_data.get('kind')
-        year = t_data.get('year')
-        return (
-            kind_scores.get(kind, 0),
-            1 if year not in (None, '', 'None') else 0,
-        )
-
     for i, t_data in titles_list:
         til = t_data['title']
         ratios = [ratcliff(title, til, sm1) + 0.1,
@@ -365,7 +372,7 @@ def scan_titles(titles_list, title, results=0, ro_threshold=RO_THRESHOLD):
             else:
                 resd[i] = (ratio, (i, t_data))
     res = list(resd.values())
-    res.sort(key=lambda item: (item[0],) + _sort_score(item[1][1]), reverse=True)
+    res.sort(key=_title_sort_key, reverse=True)
     if results > 0:
         res[:] = res[:results]
     return res
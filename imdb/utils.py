@@ -22,8 +22,8 @@ This module provides basic utilities for the imdb package.
 import re
 import string
 from copy import copy, deepcopy
+from datetime import date
 from functools import total_ordering
-from time import strftime, strptime
 
 from imdb import linguistics
 from imdb._exceptions import IMDbParserError
@@ -58,14 +58,10 @@ KIND_MAP = {
     'tv special': 'tv special'
 }
 
-# Match only the imdbIndex (for name strings).
-re_index = re.compile(r'^\(([IVXLCDM]+)\)$')
-
 # Match things inside parentheses.
 re_parentheses = re.compile(r'(\(.*\))')
 
-# Match the number of episodes.
-re_episodes = re.compile(r'\s?\((\d+) episodes\)', re.I)
+# Match the "{Episode title (YYYY-MM-DD) (#season.episode)}" format.
 re_episode_info = re.compile(
     r'{\s*(.+?)?\s?(\([0-9\?]{4}-[0-9\?]{1,2}-[0-9\?]{1,2}\))?\s?(\(#[0-9]+\.[0-9]+\))?}'
 )
@@ -88,17 +84,13 @@ def canonicalName(name):
     #        (2: 229467, 3: 9901, 4: 2041, 5: 630)
     #      - Jr.: 8025
     # Don't convert names already in the canonical format.
-    if name.find(', ') != -1:
+    if ', ' in name:
         return name
-    joiner = '%s, %s'
-    sur_joiner = '%s %s'
-    sur_space = ' %s'
-    space = ' '
     sname = name.split(' ')
     snl = len(sname)
     if snl == 2:
         # Just a name and a surname: how boring...
-        name = joiner % (sname[1], sname[0])
+        name = f'{sname[1]}, {sname[0]}'
     elif snl > 2:
         lsname = [x.lower() for x in sname]
         if snl == 3:
@@ -111,31 +103,30 @@ def canonicalName(name):
                 continue
             try:
                 # Build the surname.
-                surn = sur_joiner % (sname[index], sname[index + 1])
+                surn = f'{sname[index]} {sname[index + 1]}'
                 del sname[index]
                 del sname[index]
                 try:
                     # Handle the "Jr." after the name.
                     if lsname[index + 2].startswith('jr'):
-                        surn += sur_space % sname[index]
+                        surn += f' {sname[index]}'
                         del sname[index]
                 except (IndexError, ValueError):
                     pass
-                name = joiner % (surn, space.join(sname))
+                name = f"{surn}, {' '.join(sname)}"
                 break
             except ValueError:
                 continue
         else:
-            name = joiner % (sname[-1], space.join(sname[:-1]))
+            name = f"{sname[-1]}, {' '.join(sname[:-1])}"
     return name
 
 
 def normalizeName(name):
     """Return a name in the normal "Name Surname" format."""
-    joiner = '%s %s'
     sname = name.split(', ')
     if len(sname) == 2:
-        name = joiner % (sname[1], sname[0])
+        name = f'{sname[1]} {sname[0]}'
     return name
 
 
@@ -157,7 +148,8 @@ def analyze_name(name, canonical=None):
     cpi = name.rfind(')')
     # Strip  notes (but not if the name starts with a parenthesis).
     if opi not in (-1, 0) and cpi > opi:
-        if re_index.match(name[opi:cpi + 1]):
+        # Only roman numbers (the imdbIndex) between the parentheses.
+        if cpi > opi + 1 and not name[opi + 1:cpi].strip('IVXLCDM'):
             imdbIndex = name[opi + 1:cpi]
             name = name[:opi].rstrip()
         else:
@@ -442,8 +434,16 @@ def analyze_title(title, canonical=None, canonicalSeries=None, canonicalEpisode=
     return result
 
 
-_web_format = '%d %B %Y'
-_ptdf_format = '(%Y-%m-%d)'
+# Month names, as used in the "Episode dated 5 March 2005" web format.
+_month_names = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November',
+                'December')
+_month_numbers = {name.lower(): i for i, name in enumerate(_month_names, 1)}
+
+
+def _isDateField(value, minLen, maxLen):
+    """Return True if value is made only of minLen to maxLen ASCII digits."""
+    return minLen <= len(value) <= maxLen and value.isascii() and value.isdigit()
 
 
 def _convertTime(title, fromPTDFtoWEB=True):
@@ -452,18 +452,22 @@ def _convertTime(title, fromPTDFtoWEB=True):
     fromPTDFtoWEB is false, the inverted conversion is applied."""
     try:
         if fromPTDFtoWEB:
-            from_format = _ptdf_format
-            to_format = _web_format
+            if title[:1] != '(' or title[-1:] != ')':
+                return title
+            year, month, day = title[1:-1].split('-')
+            if not (_isDateField(year, 4, 4) and _isDateField(month, 1, 2) and _isDateField(day, 1, 2)):
+                return title
+            d = date(int(year), int(month), int(day))
+            title = 'Episode dated %d %s %d' % (d.day, _month_names[d.month - 1], d.year)
         else:
-            from_format = 'Episode dated %s' % _web_format
-            to_format = _ptdf_format
-        t = strptime(title, from_format)
-        title = strftime(to_format, t)
-        if fromPTDFtoWEB:
-            if title[0] == '0':
-                title = title[1:]
-            title = 'Episode dated %s' % title
-    except ValueError:
+            if not title.startswith('Episode dated '):
+                return title
+            day, month, year = title[14:].split()
+            if not (_isDateField(year, 4, 4) and _isDateField(day, 1, 2)):
+                return title
+            d = date(int(year), _month_numbers[month.lower()], int(day))
+            title = '(%d-%02d-%02d)' % (d.year, d.month, d.day)
+    except (KeyError, ValueError):
         pass
     return title
 
@@ -565,16 +569,20 @@ def build_title(title_dict, canonical=None, canonicalSeries=None,
     return title
 
 
+# Characters stripped from company names in the "[...]" form.
+_re_company_chars = re.compile(r'[!@#$\(\)\[\]]')
+
+
 def split_company_name_notes(name):
     """Return two strings, the first representing the company name,
     and the other representing the (optional) notes."""
     name = name.strip()
     notes = ''
     if name.endswith(')'):
-        fpidx = name.find('(')
-        if fpidx != -1:
-            notes = name[fpidx:]
-            name = name[:fpidx].rstrip()
+        cname, sep, cnotes = name.partition('(')
+        if sep:
+            notes = sep + cnotes
+            name = cname.rstrip()
     return name, notes
 
 
@@ -591,7 +599,7 @@ def analyze_company_name(name, stripNotes=False):
     name = name.strip()
     country = None
     if name.startswith('['):
-        name = re.sub(r'[!@#$\(\)\[\]]', '', name)
+        name = _re_company_chars.sub('', name)
     else:
         if name.endswith(']'):
             idx = name.rfind('[')
@@ -784,6 +792,10 @@ def modClearCharacterRefs(s, titlesRefs, namesRefs, charactersRefs):
 
 def modClearRefs(s, titlesRefs, namesRefs, charactersRefs):
     """Remove titles, names and characters references."""
+    # Every kind of reference ends with " (qv)": skip the scan when
+    # there can't be any.
+    if '(qv)' not in s:
+        return s
     s = modClearTitleRefs(s, {}, {}, {})
     s = modClearCharacterRefs(s, {}, {}, {})
     return modClearNameRefs(s, {}, {}, {})
@@ -906,10 +918,10 @@ def _refsToReplace(value, modFunct, titlesRefs, namesRefs, charactersRefs):
 
 def _handleTextNotes(s):
     """Split text::notes strings."""
-    ssplit = s.split('::', 1)
-    if len(ssplit) == 1:
+    text, sep, notes = s.partition('::')
+    if not sep:
         return s
-    return '%s<notes>%s</notes>' % (ssplit[0], ssplit[1])
+    return '%s<notes>%s</notes>' % (text, notes)
 
 
 def _normalizeValue(value, withRefs=False, modFunct=None, titlesRefs=None,
@@ -1172,19 +1184,15 @@ class _Container:
             data = {}
         self.set_data(data, override=True)
         self.notes = notes
-        if titlesRefs is None:
-            titlesRefs = {}
-        self.update_titlesRefs(titlesRefs)
-        if namesRefs is None:
-            namesRefs = {}
-        self.update_namesRefs(namesRefs)
-        if charactersRefs is None:
-            charactersRefs = {}
-        self.update_charactersRefs(charactersRefs)
+        # reset() already left empty references dictionaries.
+        if titlesRefs:
+            self.update_titlesRefs(titlesRefs)
+        if namesRefs:
+            self.update_namesRefs(namesRefs)
+        if charactersRefs:
+            self.update_charactersRefs(charactersRefs)
         self.set_mod_funct(modFunct)
-        self.keys_tomodify = {}
-        for item in self.keys_tomodify_list:
-            self.keys_tomodify[item] = None
+        self.keys_tomodify = dict.fromkeys(self.keys_tomodify_list)
         self._roleIsPerson = roleIsPerson
         if not roleIsPerson:
             from imdb.Character import Character
@@ -1608,23 +1616,30 @@ def flatten(seq, toDescend=(list, dict, tuple), yieldDictKeys=False,
     if scalar is None or isinstance(seq, scalar):
         yield seq
     if isinstance(seq, toDescend):
+        # Items that can't be descended are handled here, instead of
+        # creating a nested generator just to yield (or skip) them.
         if isinstance(seq, (dict, _Container)):
             if yieldDictKeys:
                 # Yield also the keys of the dictionary.
                 for key in seq.keys():
-                    for k in flatten(key, toDescend=toDescend,
-                                     yieldDictKeys=yieldDictKeys,
-                                     onlyKeysType=onlyKeysType, scalar=scalar):
-                        if onlyKeysType and isinstance(k, onlyKeysType):
-                            yield k
-            for value in seq.values():
-                for v in flatten(value, toDescend=toDescend,
-                                 yieldDictKeys=yieldDictKeys,
-                                 onlyKeysType=onlyKeysType, scalar=scalar):
-                    yield v
+                    if isinstance(key, toDescend):
+                        for k in flatten(key, toDescend=toDescend,
+                                         yieldDictKeys=yieldDictKeys,
+                                         onlyKeysType=onlyKeysType, scalar=scalar):
+                            if onlyKeysType and isinstance(k, onlyKeysType):
+                                yield k
+                    elif (scalar is None or isinstance(key, scalar)) and \
+                            onlyKeysType and isinstance(key, onlyKeysType):
+                        yield key
+            items = seq.values()
         elif not isinstance(seq, (str, bytes, int, float)):
-            for item in seq:
-                for i in flatten(item, toDescend=toDescend,
-                                 yieldDictKeys=yieldDictKeys,
-                                 onlyKeysType=onlyKeysType, scalar=scalar):
-                    yield i
+            items = seq
+        else:
+            return
+        for item in items:
+            if isinstance(item, toDescend):
+                yield from flatten(item, toDescend=toDescend,
+                                   yieldDictKeys=yieldDictKeys,
+                                   onlyKeysType=onlyKeysType, scalar=scalar)
+            elif scalar is None or isinstance(item, scalar):
+                yield item
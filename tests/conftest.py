@@ -2,6 +2,7 @@ from pytest import fixture
 
 import logging
 import os
+import shutil
 from pathlib import Path
 
 from imdb import Cinemagoer
@@ -22,3 +23,11 @@ def ia(request):
     """Access to IMDb data."""
     if request.param == 's3':
         yield Cinemagoer('s3', uri=s3_uri)
+
+
+@fixture
+def partial_db_copy(tmp_path):
+    """A copy of the partial database, that can be modified."""
+    db = tmp_path / 'partial.db'
+    shutil.copyfile(partial_db, db)
+    return db
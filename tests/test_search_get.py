@@ -1,5 +1,8 @@
 import pytest
 
+import sqlite3
+
+from imdb import Cinemagoer
 from imdb.Character import Character
 
 
@@ -56,4 +59,23 @@ def test_movie_cast_contains_character_roles(ia):
 
 @pytest.mark.xfail(reason='standalone character search/get is not available in the S3 backend', raises=AttributeError)
 def test_character_search_and_get_not_available(ia):
-    ia.search_character('The Queen')
\ No newline at end of file
+    ia.search_character('The Queen')
+
+
+def test_get_person_known_for_missing_title(partial_db_copy):
+    with sqlite3.connect(partial_db_copy) as conn:
+        conn.execute("UPDATE name_basics SET knownForTitles = '0000009,99999999' WHERE nconst = 1")
+    conn.close()
+
+    person = Cinemagoer('s3', uri=f'sqlite:///{partial_db_copy}').get_person('1')
+    known_for = person['known for']
+    assert [movie.movieID for movie in known_for] == [9, 99999999]
+    assert known_for[0]['title'] == 'Miss Jerry'
+    assert known_for[1].get('title') is None
+
+
+@pytest.mark.filterwarnings('error::sqlalchemy.exc.SADeprecationWarning')
+def test_search_person_without_soundex(partial_db_copy):
+    # No soundex for the name: all of name_basics is scanned.
+    ia = Cinemagoer('s3', uri=f'sqlite:///{partial_db_copy}')
+    assert ia.search_person('123') == []
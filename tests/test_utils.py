@@ -0,0 +1,64 @@
+import pickle
+
+from imdb.Movie import Movie
+from imdb.Person import Person
+from imdb.utils import RolesList, analyze_name, build_title, modClearRefs
+
+
+def _episode(title):
+    return {
+        'kind': 'episode',
+        'title': title,
+        'year': 2005,
+        'episode of': {'title': 'The Series', 'kind': 'tv series', 'year': 2004},
+    }
+
+
+def test_build_title_episode_dated_from_ptdf():
+    assert build_title(_episode('(2005-03-05)')) == '"The Series" Episode dated 5 March 2005 (2005)'
+
+
+def test_build_title_episode_dated_to_ptdf():
+    assert build_title(_episode('Episode dated 5 March 2005'), ptdf=True) == '"The Series" (2004) {(2005-03-05)}'
+
+
+def test_build_title_episode_invalid_date_is_unchanged():
+    assert build_title(_episode('Episode dated 31 February 2005'), ptdf=True) == \
+        '"The Series" (2004) {Episode dated 31 February 2005}'
+
+
+def test_build_title_episode_malformed_date_is_unchanged():
+    for title in ('(2005-1_0-05)', '(2005-01-+5)', '( 2005-1-5)', '(05-01-05)'):
+        assert build_title(_episode(title)) == '"The Series" %s (2005)' % title
+    for title in ('Episode dated 5 March 999', 'Episode dated +5 March 2005', 'Episode dated 5 March 2_05'):
+        assert build_title(_episode(title), ptdf=True) == '"The Series" (2004) {%s}' % title
+
+
+def test_analyze_name_imdb_index():
+    assert analyze_name('Fred Astaire (XIV)') == {'name': 'Fred Astaire', 'imdbIndex': 'XIV'}
+    assert analyze_name('Fred Astaire (1926-2004)') == {'name': 'Fred Astaire'}
+    assert analyze_name('Fred Astaire ()') == {'name': 'Fred Astaire'}
+
+
+def test_mod_clear_refs():
+    text = "_The Matrix (1999)_ (qv) with 'Keanu Reeves' (qv) as #Neo# (qv)"
+    assert modClearRefs(text, {}, {}, {}) == 'The Matrix (1999) with Keanu Reeves as Neo'
+    assert modClearRefs('no references here', {}, {}, {}) == 'no references here'
+
+
+def test_multiple_roles_with_scalar_role_id():
+    person = Person(name='X', currentRole=['Neo', 'Thomas Anderson'], roleID='ch0001')
+    assert str(person.currentRole) == 'Neo / Thomas Anderson'
+    movie = Movie(title='X', currentRole=['A', 'B'], roleID=5)
+    assert str(movie.currentRole) == 'A / B'
+
+
+def test_pickle_multiple_roles():
+    roles = RolesList(['Neo', 'Thomas Anderson'])
+    roles.notes = '(voice)'
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(roles, protocol))
+        assert copied == roles
+        assert copied.notes == '(voice)'
+    movie = Movie(title='X', currentRole=['A', 'B'])
+    assert str(pickle.loads(pickle.dumps(movie, 0)).currentRole) == 'A / B'